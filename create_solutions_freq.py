@@ -18,9 +18,17 @@ Output:
     - solutions_with_freq.csv: word,frequency (sorted by frequency desc)
 """
 
+import mmap
 import os
+import re
 import sys
+from operator import itemgetter
 from pathlib import Path
+from typing import Optional
+
+
+# 5-letter "word<tab>count" rows; other words can never be Wordle solutions
+FREQ_LINE_RE = re.compile(rb'^([A-Za-z]{5})\t(\d+)(?=\s|$)', re.MULTILINE)
 
 
 def load_solutions(filepath: str) -> list[str]:
@@ -30,19 +38,23 @@ def load_solutions(filepath: str) -> list[str]:
     return [w for w in words if len(w) == 5 and w.isalpha()]
 
 
-def load_frequencies(filepath: str) -> dict[str, int]:
-    """Load word frequency data (word<tab>count format)."""
+def load_frequencies(filepath: str, keep: Optional[set[str]] = None) -> dict[str, int]:
+    """
+    Load 5-letter word frequency data (word<tab>count format).
+    
+    The file is memory-mapped and parsed with a single regex pass instead of
+    splitting it line by line in Python. If `keep` is given, only those words
+    are stored.
+    """
     freq = {}
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            parts = line.strip().split('\t')
-            if len(parts) >= 2:
-                word = parts[0].lower()
-                try:
-                    count = int(parts[1])
-                    freq[word] = count
-                except ValueError:
-                    continue
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return freq
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for word, count in FREQ_LINE_RE.findall(mm):
+                word = word.decode('ascii').lower()
+                if keep is None or word in keep:
+                    freq[word] = int(count)
     return freq
 
 
@@ -62,8 +74,8 @@ def create_solutions_with_freq(
     print(f"  → Loaded {len(solutions)} solution words")
     
     print(f"\nLoading frequencies from: {freq_file}")
-    frequencies = load_frequencies(freq_file)
-    print(f"  → Loaded {len(frequencies)} word frequencies")
+    frequencies = load_frequencies(freq_file, keep=set(solutions))
+    print(f"  → Loaded {len(frequencies)} solution word frequencies")
     
     # Cross-reference
     print("\nCross-referencing...")
@@ -80,7 +92,7 @@ def create_solutions_with_freq(
             not_found.append(word)
     
     # Sort by frequency (descending)
-    results.sort(key=lambda x: -x[1])
+    results.sort(key=itemgetter(1), reverse=True)
     
     # Save to CSV
     print(f"\nSaving to: {output_file}")
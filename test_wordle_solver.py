@@ -0,0 +1,69 @@
+"""
+Pattern engine checks: every builder must agree with a plain string
+implementation of Wordle's feedback rules, especially on repeated letters.
+
+Run with: python -m pytest
+"""
+
+import numpy as np
+import pytest
+
+import wordle_solver as ws
+
+# Repeated letters in the guess, the answer, or both
+WORDS = """
+eerie there sassy asses speed abide geese eagle llama label allay added
+daddy mamma emcee tepee belle alley lolly hello steel sleet stele teems
+crane slate
+""".split()
+
+
+def reference_pattern(guess: str, answer: str) -> str:
+    """Greens first, then yellows left to right while unmatched copies remain."""
+    result = ['x'] * 5
+    remaining = list(answer)
+    for i in range(5):
+        if guess[i] == answer[i]:
+            result[i] = 'g'
+            remaining[i] = None
+    for i in range(5):
+        if result[i] != 'g' and guess[i] in remaining:
+            result[i] = 'y'
+            remaining[remaining.index(guess[i])] = None
+    return ''.join(result)
+
+
+EXPECTED = np.array([[ws.encode_pattern(reference_pattern(g, a)) for a in WORDS] for g in WORDS],
+                    dtype=np.uint8)
+
+
+def test_reference_examples():
+    assert reference_pattern("eerie", "there") == "yxyxg"
+    assert reference_pattern("sassy", "asses") == "yygyx"
+
+
+def test_pattern_code():
+    letters = ws.words_to_letters(WORDS).tolist()
+    codes = [[ws.pattern_code(g, a) for a in letters] for g in letters]
+    assert np.array_equal(codes, EXPECTED)
+    assert all(ws.WordleSolver.get_pattern(g, a) == reference_pattern(g, a)
+               for g in WORDS for a in WORDS)
+
+
+def test_compute_pattern_codes():
+    letters = ws.words_to_letters(WORDS)
+    assert np.array_equal(ws.compute_pattern_codes(letters, letters), EXPECTED)
+    # Blocks of only repeated-letter or only distinct-letter guesses
+    for guess in ("eerie", "crane"):
+        row = ws.compute_pattern_codes(ws.words_to_letters([guess]), letters)[0]
+        assert np.array_equal(row, EXPECTED[WORDS.index(guess)])
+
+
+@pytest.mark.skipif(ws.njit is None, reason="Numba not installed")
+def test_pattern_matrix_kernel():
+    letters = ws.words_to_letters(WORDS)
+    # Answers are every other word; answer_rows maps them back to guess rows
+    answer_rows = np.arange(0, len(WORDS), 2, dtype=np.int32)
+    answers = letters[answer_rows]
+    matrix = ws._pattern_matrix_kernel(letters, answers, answer_rows, ws.letters_to_masks(answers))
+    assert np.array_equal(matrix, EXPECTED[:, answer_rows])
@@ -18,9 +18,20 @@ Input format for clues:
 Example: If you guessed "CRANE" and got ⬛🟨🟩⬛🟩, enter: xygxg
 """
 
+import hashlib
+import json
 import math
-from collections import Counter
-from typing import Optional
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Union
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the pattern matrix falls back to NumPy
+    njit = None
 
 # =============================================================================
 # WORD LIST CONFIGURATION
@@ -36,6 +47,12 @@ WORD_LIST_FILE = "words.txt"
 # Path to solutions with frequency file for bot mode (CSV: word,frequency)
 SOLUTIONS_FREQ_FILE = "solutions_with_freq.csv"
 
+# Directory (next to this script) for cached pattern matrices and opening rankings
+CACHE_DIR = ".wordle_cache"
+
+# Number of ranked opening guesses stored in the opening cache
+OPENING_CACHE_SIZE = 100
+
 # Fallback words if file not found (minimal set for emergencies)
 FALLBACK_WORDS = """
 about crane slate trace audio adieu raise arose salet reast stare snare irate
@@ -43,6 +60,290 @@ later alert alter laser saner nears learn renal liner riles tiles stile smile
 miles limes slime motes tomes notes tones stone onset pores spore ropes store
 """.split()
 
+# =============================================================================
+# PATTERN ENCODING
+# =============================================================================
+
+# Feedback patterns are stored as base-3 integers: x=0, y=1, g=2, with
+# position 0 as the least significant digit. 3^5 = 243 codes fit in a uint8.
+NUM_PATTERNS = 3 ** 5
+PATTERN_DIGITS = {'x': 0, 'y': 1, 'g': 2}
+PATTERN_WEIGHTS = np.array([1, 3, 9, 27, 81], dtype=np.uint8)
+
+# Guess rows computed per vectorized block when building the pattern matrix
+PATTERN_BLOCK_SIZE = 256
+
+# Candidate rows scored per vectorized block when ranking guesses
+SCORE_BLOCK_SIZE = 256
+
+# Candidates scored between progress updates (a multiple of SCORE_BLOCK_SIZE)
+PROGRESS_INTERVAL = 2048
+
+# Minimum candidates x answers before the NumPy scorer splits work across
+# processes (~0.1s of serial scoring; smaller sweeps lose to dispatch overhead)
+PARALLEL_MIN_WORK = 20_000_000
+
+# Decimals entropy is rounded to for ranking: equal splits can differ in the
+# last bits depending on summation order (NumPy vs Numba), and must still tie
+RANK_DECIMALS = 9
+
+# Answer pools whose candidate scores are kept in memory (least recently used dropped first)
+SCORE_CACHE_SIZE = 16
+
+# With this many answers or fewer left, the answers are scored first. If one
+# splits the pool perfectly (every feedback distinct), no guess can beat it and
+# answers win ties, so the sweep over all other words is skipped.
+SMALL_POOL_SIZE = 10
+
+
+def encode_pattern(pattern: str) -> int:
+    """Encode a g/y/x pattern string as its base-3 integer code."""
+    return sum(PATTERN_DIGITS[c] * 3 ** i for i, c in enumerate(pattern))
+
+
+def decode_pattern(code: int) -> str:
+    """Decode a base-3 pattern code back to its g/y/x string."""
+    chars = []
+    for _ in range(5):
+        code, digit = divmod(code, 3)
+        chars.append('xyg'[digit])
+    return ''.join(chars)
+
+
+def pattern_code(guess: list[int], answer: list[int],
+                 answer_counts: Optional[list[int]] = None) -> int:
+    """
+    Compute the base-3 feedback code for one guess/answer pair.
+    
+    Both words are given as 5 letter indices (a=0 ... z=25). answer_counts,
+    the answer's 26 per-letter counts, is computed when not supplied. Greens
+    claim their letter first; each other guess letter is yellow while an
+    unclaimed copy remains.
+    """
+    if answer_counts is None:
+        counts = [0] * 26
+        for a in answer:
+            counts[a] += 1
+    else:
+        counts = list(answer_counts)
+    
+    code = 0
+    for p in range(5):
+        if guess[p] == answer[p]:
+            code += 2 * 3 ** p
+            counts[guess[p]] -= 1
+    for p in range(5):
+        g = guess[p]
+        if g != answer[p] and counts[g] > 0:
+            code += 3 ** p
+            counts[g] -= 1
+    return code
+
+
+def words_to_letters(words: list[str]) -> np.ndarray:
+    """Convert words to an (N, 5) uint8 array of letter indices (a=0 ... z=25)."""
+    data = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    return data.reshape(-1, 5) - ord('a')
+
+
+def letters_to_counts(letters: np.ndarray) -> np.ndarray:
+    """Convert an (N, 5) letter array to (N, 26) uint8 per-letter counts."""
+    counts = np.zeros((len(letters), 26), dtype=np.uint8)
+    for pos in range(5):
+        np.add.at(counts, (np.arange(len(letters)), letters[:, pos]), 1)
+    return counts
+
+
+def letters_to_masks(letters: np.ndarray) -> np.ndarray:
+    """Convert an (N, 5) letter array to uint32 letter-presence masks (bit k = letter k)."""
+    return np.bitwise_or.reduce(np.left_shift(np.uint32(1), letters.astype(np.uint32)), axis=1)
+
+
+def masks_to_bits(masks: np.ndarray) -> np.ndarray:
+    """Expand uint32 letter masks to an (N, 26) 0/1 array."""
+    return (masks[:, None] >> np.arange(26, dtype=np.uint32)) & 1
+
+
+def compute_pattern_codes(guesses: np.ndarray, answers: np.ndarray,
+                          answer_counts: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute feedback pattern codes for every (guess, answer) pair.
+    
+    Args:
+        guesses: (G, 5) letter array
+        answers: (A, 5) letter array
+        answer_counts: (A, 26) per-letter counts of answers (computed if omitted)
+        
+    Returns: (G, A) uint8 array of base-3 pattern codes
+    
+    A non-green guess letter is yellow when the answer still has an unused
+    copy of it: copies in the answer, minus those consumed by greens, minus
+    those consumed by earlier yellow/gray copies in the guess.
+    """
+    if answer_counts is None:
+        answer_counts = letters_to_counts(answers)
+    
+    # Guesses without repeated letters skip the duplicate bookkeeping below
+    # entirely (a letter is yellow iff the answer has it), so score them apart
+    ordered = np.sort(guesses, axis=1)
+    repeats = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+    if repeats.any() and not repeats.all():
+        codes = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+        codes[~repeats] = compute_pattern_codes(guesses[~repeats], answers, answer_counts)
+        codes[repeats] = compute_pattern_codes(guesses[repeats], answers, answer_counts)
+        return codes
+    
+    # Letter-major layout so each guess letter gathers one contiguous row
+    counts_by_letter = np.ascontiguousarray(answer_counts.T, dtype=np.int8)
+    
+    greens = guesses[:, None, :] == answers[None, :, :]
+    same_letter = guesses[:, :, None] == guesses[:, None, :]
+    codes = np.zeros((len(guesses), len(answers)), dtype=np.uint8)
+    
+    for i in range(5):
+        available = counts_by_letter[guesses[:, i]]
+        for k in range(5):
+            shared = same_letter[:, i, k]
+            if k == i or not shared.any():
+                continue
+            # Copies of this letter consumed by a green elsewhere
+            available = available - (greens[:, :, k] & shared[:, None])
+            # ...or by an earlier non-green occurrence in the guess
+            if k < i:
+                available = available - (~greens[:, :, k] & shared[:, None])
+        digit = np.where(greens[:, :, i], 2, available > 0).astype(np.uint8)
+        codes += digit * PATTERN_WEIGHTS[i]
+    
+    return codes
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _pattern_matrix_kernel(guesses, answers, answer_rows, answer_masks):
+        """
+        Numba version of compute_pattern_codes, parallel over guess rows.
+        
+        answer_rows[j] is the guess row of answer j; those pairs are the same
+        word and get the all-green code without any comparisons. A guess with
+        five distinct letters only needs answer_masks: each non-green letter
+        is yellow iff the answer contains it.
+        """
+        n_guesses = guesses.shape[0]
+        n_answers = answers.shape[0]
+        matrix = np.empty((n_guesses, n_answers), dtype=np.uint8)
+        all_green = NUM_PATTERNS - 1
+        
+        for i in prange(n_guesses):
+            # Answer letters not claimed by a green; reused across answers
+            unmatched = np.zeros(26, dtype=np.int8)
+            distinct = True
+            seen = 0
+            for p in range(5):
+                bit = np.uint32(1) << np.uint32(guesses[i, p])
+                if seen & bit:
+                    distinct = False
+                seen |= bit
+            
+            for j in range(n_answers):
+                if answer_rows[j] == i:
+                    matrix[i, j] = all_green
+                    continue
+                
+                if distinct:
+                    code = 0
+                    weight = 1
+                    for p in range(5):
+                        g = guesses[i, p]
+                        if g == answers[j, p]:
+                            code += 2 * weight
+                        elif answer_masks[j] & (np.uint32(1) << np.uint32(g)):
+                            code += weight
+                        weight *= 3
+                    matrix[i, j] = code
+                    continue
+                
+                for p in range(5):
+                    if guesses[i, p] != answers[j, p]:
+                        unmatched[answers[j, p]] += 1
+                
+                code = 0
+                weight = 1
+                for p in range(5):
+                    g = guesses[i, p]
+                    if g == answers[j, p]:
+                        code += 2 * weight
+                    elif unmatched[g] > 0:
+                        code += weight
+                        unmatched[g] -= 1
+                    weight *= 3
+                matrix[i, j] = code
+                
+                for p in range(5):
+                    unmatched[answers[j, p]] = 0
+        
+        return matrix
+    
+    @njit(parallel=True, cache=True)
+    def _score_kernel(matrix, candidates, answer_indices):
+        """Numba version of the blocked NumPy scoring, parallel over candidates."""
+        n_candidates = candidates.shape[0]
+        total = answer_indices.shape[0]
+        entropy = np.empty(n_candidates)
+        expected = np.empty(n_candidates)
+        
+        for c in prange(n_candidates):
+            counts = np.zeros(NUM_PATTERNS, dtype=np.int64)
+            row = candidates[c]
+            for k in range(total):
+                counts[matrix[row, answer_indices[k]]] += 1
+            
+            ent = 0.0
+            squares = 0
+            for b in range(NUM_PATTERNS):
+                if counts[b] > 0:
+                    p = counts[b] / total
+                    ent -= p * np.log2(p)
+                    squares += counts[b] * counts[b]
+            entropy[c] = ent
+            expected[c] = squares / total
+        
+        return entropy, expected
+
+
+# Worker-process copy of the solver whose pattern matrix it scores against
+_worker_solver = None
+
+
+def _init_score_worker(solver: "WordleSolver"):
+    """Worker initializer; with fork the solver is inherited, not pickled."""
+    global _worker_solver
+    _worker_solver = solver
+
+
+def _score_chunk(candidates: np.ndarray, answer_indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Worker entry point: score a slice of candidates against the given answer pool."""
+    # The inherited solver may predate later guesses, so the pool comes with the task
+    _worker_solver.answer_indices = answer_indices
+    return _worker_solver._score_blocks(candidates)
+
+
+def top_k_order(keys: tuple[np.ndarray, ...], k: int) -> np.ndarray:
+    """
+    First k indices of np.lexsort(keys), without sorting every row.
+    
+    Rows are preselected with np.partition on the primary key (keys[-1]),
+    keeping every row that ties the k-th value, so the result is identical
+    to the full sort. NaN primary keys sort last, as with np.lexsort.
+    """
+    primary = keys[-1]
+    if len(primary) <= k:
+        return np.lexsort(keys)
+    kth = np.partition(primary, k - 1)[k - 1]
+    if np.isnan(kth):
+        return np.lexsort(keys)[:k]
+    subset = np.flatnonzero(primary <= kth)
+    return subset[np.lexsort(tuple(key[subset] for key in keys))][:k]
+
 
 class WordleSolver:
     """
@@ -72,20 +373,55 @@ class WordleSolver:
         if bot_mode:
             self.solutions_list, self.word_frequencies = self._load_solutions_with_freq(solutions_file)
             if self.solutions_list:
-                self.possible_answers = set(self.solutions_list)
                 print(f"🤖 BOT MODE: Using {len(self.solutions_list)} curated solutions")
             else:
                 print("⚠ Bot mode requested but solutions file not found. Using standard mode.")
                 self.bot_mode = False
-                self.possible_answers = set(self.all_words)
                 self.word_frequencies = {}
         else:
-            self.possible_answers = set(self.all_words)
             self.word_frequencies = {}
             self.solutions_list = []
         
-        self.guesses_made: list[tuple[str, str]] = []
+        # Every answer must also be a valid guess
+        missing = set(self.solutions_list) - set(self.all_words)
+        if missing:
+            self.all_words = sorted(set(self.all_words) | missing)
+        
+        # (guess row, pattern code) pairs; converted to text only for display
+        self.guesses_made: list[tuple[int, int]] = []
+        
+        # Index words for the precomputed pattern matrix:
+        # rows are valid guesses, columns are potential answers
+        self.answer_words = self.solutions_list if self.bot_mode else self.all_words
+        self.word_to_idx = {word: i for i, word in enumerate(self.all_words)}
+        self.answer_to_idx = {word: i for i, word in enumerate(self.answer_words)}
+        self.answer_rows = np.array([self.word_to_idx[w] for w in self.answer_words], dtype=np.int32)
+        self.all_rows = np.arange(len(self.all_words), dtype=np.int32)
+        self.letters = words_to_letters(self.all_words)
+        self.letter_masks = letters_to_masks(self.letters)
         self.letter_freq = self._compute_letter_frequencies()
+        self.word_scores = self._compute_word_scores()
+        self.answer_letters = words_to_letters(self.answer_words)
+        self.answer_letter_counts = letters_to_counts(self.answer_letters)
+        self.pattern_matrix = self._build_pattern_matrix()
+        
+        # Remaining possible answers, as column indices into the pattern matrix
+        self.answer_indices = np.arange(len(self.answer_words), dtype=np.int32)
+        
+        # Answer state id -> (entropy by row, expected by row), least recently used first
+        self._score_cache: OrderedDict[bytes, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        
+        # Worker processes for large NumPy scoring sweeps (see _score_forked)
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    @property
+    def possible_answers(self) -> set[str]:
+        """Remaining possible answers as words (see answer_indices for the index form)."""
+        return {self.answer_words[i] for i in self.answer_indices}
+    
+    def _answer_state_id(self) -> bytes:
+        """64-bit hash of the remaining answer pool (equal pools give equal ids)."""
+        return hashlib.blake2b(self.answer_indices.tobytes(), digest_size=8).digest()
     
     def _load_solutions_with_freq(self, solutions_file: str = None) -> tuple[list[str], dict[str, int]]:
         """
@@ -105,12 +441,18 @@ class WordleSolver:
                 try:
                     solutions = []
                     frequencies = {}
-                    with open(path, 'r', encoding='utf-8') as f:
-                        reader = csv.DictReader(f)
+                    with open(path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                        # Indexed rows: no per-row dict as with csv.DictReader
+                        reader = csv.reader(f)
+                        header = next(reader)
+                        word_col = header.index('word')
+                        freq_col = header.index('frequency') if 'frequency' in header else None
                         for row in reader:
-                            word = row['word'].lower().strip()
-                            freq = int(row.get('frequency', 1))
-                            if len(word) == 5 and word.isalpha():
+                            if not row:
+                                continue
+                            word = row[word_col].lower().strip()
+                            freq = int(row[freq_col]) if freq_col is not None and freq_col < len(row) else 1
+                            if len(word) == 5 and word.isascii() and word.isalpha():
                                 solutions.append(word)
                                 frequencies[word] = freq
                     if solutions:
@@ -141,10 +483,10 @@ class WordleSolver:
         for path in search_paths:
             if os.path.exists(path):
                 try:
+                    # One bulk read + split instead of per-line strip/lower
                     with open(path, 'r', encoding='utf-8') as f:
-                        words = [line.strip().lower() for line in f]
-                    words = [w for w in words if len(w) == 5 and w.isalpha()]
-                    words = list(set(words))
+                        words = f.read().lower().split()
+                    words = {w for w in words if len(w) == 5 and w.isascii() and w.isalpha()}
                     if words:
                         print(f"✓ Loaded {len(words)} words from: {path}")
                         return sorted(words)
@@ -159,11 +501,104 @@ class WordleSolver:
     
     def _compute_letter_frequencies(self) -> dict[str, float]:
         """Compute letter frequencies for tiebreaking."""
-        freq: Counter = Counter()
-        for word in self.all_words:
-            freq.update(set(word))
-        total = sum(freq.values())
-        return {letter: count / total for letter, count in freq.items()}
+        # Number of words containing each letter, from the letter masks
+        counts = masks_to_bits(self.letter_masks).sum(axis=0)
+        total = counts.sum()
+        return {chr(ord('a') + k): float(counts[k] / total) for k in range(26) if counts[k]}
+    
+    @staticmethod
+    def _cache_path(filename: str) -> str:
+        """Path of a cache file in CACHE_DIR next to this script."""
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), CACHE_DIR, filename)
+    
+    def _word_list_hash(self) -> str:
+        """Short hash identifying the guess and answer lists (cache key)."""
+        digest = hashlib.sha1()
+        digest.update('\n'.join(self.all_words).encode('ascii'))
+        digest.update(b'\0')
+        digest.update('\n'.join(self.answer_words).encode('ascii'))
+        return digest.hexdigest()[:16]
+    
+    def _build_pattern_matrix(self) -> np.ndarray:
+        """
+        Precompute feedback codes for every (guess, answer) pair.
+        
+        The matrix is cached on disk, keyed by the word lists. Later runs
+        memory-map the cached file instead of rebuilding or reading it, so
+        startup is near-instant and the OS page cache is shared between
+        processes.
+        
+        Returns: (len(all_words), len(answer_words)) uint8 matrix
+        """
+        shape = (len(self.all_words), len(self.answer_words))
+        cache_path = self._cache_path(f"patterns_{self._word_list_hash()}.npy")
+        
+        if os.path.exists(cache_path):
+            try:
+                matrix = np.load(cache_path, mmap_mode='r')
+                if matrix.shape == shape and matrix.dtype == np.uint8:
+                    print(f"✓ Loaded pattern matrix from: {cache_path}")
+                    return matrix
+            except (OSError, ValueError) as e:
+                print(f"⚠ Error reading {cache_path}: {e}")
+        
+        print(f"⏳ Precomputing {shape[0]}×{shape[1]} feedback patterns...")
+        if njit is not None:
+            matrix = _pattern_matrix_kernel(self.letters, self.answer_letters, self.answer_rows,
+                                            letters_to_masks(self.answer_letters))
+        else:
+            matrix = np.empty(shape, dtype=np.uint8)
+            for start in range(0, shape[0], PATTERN_BLOCK_SIZE):
+                block = self.letters[start:start + PATTERN_BLOCK_SIZE]
+                matrix[start:start + len(block)] = compute_pattern_codes(
+                    block, self.answer_letters, self.answer_letter_counts)
+        
+        # Write then rename, so concurrent runs never map a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠ Could not cache pattern matrix: {e}")
+            # Don't leave a partial file behind (e.g. after running out of disk)
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+        
+        return matrix
+    
+    def _guess_row(self, guess: str) -> np.ndarray:
+        """Pattern codes of a guess against every answer (computed on the fly if not a known word)."""
+        gi = self.word_to_idx.get(guess)
+        if gi is not None:
+            return self.pattern_matrix[gi]
+        return compute_pattern_codes(words_to_letters([guess]), self.answer_letters,
+                                     self.answer_letter_counts)[0]
+    
+    def _pool_codes(self, guess: str, word_pool: Union[list[str], set[str], np.ndarray]) -> np.ndarray:
+        """
+        Pattern codes of a guess against a pool, in the pool's iteration order.
+        
+        The pool is either answer column indices or words. Words that are not
+        answer columns (e.g. non-solution guesses in bot mode) are computed
+        on the fly.
+        """
+        row = self._guess_row(guess)
+        if isinstance(word_pool, np.ndarray):
+            return row[word_pool]
+        
+        cols = np.fromiter((self.answer_to_idx.get(w, -1) for w in word_pool),
+                           dtype=np.int32, count=len(word_pool))
+        codes = row[cols]
+        unknown = np.flatnonzero(cols < 0)
+        if len(unknown):
+            words = list(word_pool)
+            codes[unknown] = compute_pattern_codes(words_to_letters([guess]),
+                                                   words_to_letters([words[k] for k in unknown]))[0]
+        return codes
     
     @staticmethod
     def get_pattern(guess: str, answer: str) -> str:
@@ -172,29 +607,28 @@ class WordleSolver:
         
         Returns: 'g' = green, 'y' = yellow, 'x' = gray
         """
-        pattern = ['x'] * 5
-        answer_chars = list(answer)
-        
-        # First pass: mark greens (correct position)
-        for i, (g, a) in enumerate(zip(guess, answer)):
-            if g == a:
-                pattern[i] = 'g'
-                answer_chars[i] = None
+        code = pattern_code([ord(c) - ord('a') for c in guess],
+                            [ord(c) - ord('a') for c in answer])
+        return decode_pattern(code)
+    
+    def get_pattern_code(self, gi: int, ai: int) -> int:
+        """
+        Compute the pattern code of guess row gi against answer column ai.
         
-        # Second pass: mark yellows (wrong position)
-        for i, g in enumerate(guess):
-            if pattern[i] == 'x' and g in answer_chars:
-                pattern[i] = 'y'
-                answer_chars[answer_chars.index(g)] = None
-                
-        return ''.join(pattern)
+        Scalar equivalent of pattern_matrix[gi, ai], for use without the matrix.
+        """
+        return pattern_code(self.letters[gi].tolist(), self.answer_letters[ai].tolist(),
+                            self.answer_letter_counts[ai].tolist())
     
     def filter_words(self, guess: str, pattern: str, word_pool: set[str]) -> set[str]:
         """Filter words based on guess and feedback pattern."""
-        return {
-            word for word in word_pool
-            if self.get_pattern(guess, word) == pattern
-        }
+        code = encode_pattern(pattern)
+        if isinstance(word_pool, np.ndarray):
+            return {self.answer_words[i] for i in word_pool[self._pool_codes(guess, word_pool) == code]}
+        
+        words = list(word_pool)
+        matches = np.flatnonzero(self._pool_codes(guess, words) == code)
+        return {words[k] for k in matches}
     
     def apply_guess(self, guess: str, pattern: str) -> int:
         """
@@ -205,54 +639,72 @@ class WordleSolver:
         guess = guess.lower().strip()
         pattern = pattern.lower().strip()
         
-        if len(guess) != 5 or not guess.isalpha():
+        if len(guess) != 5 or not guess.isascii() or not guess.isalpha():
             raise ValueError("Guess must be exactly 5 letters")
         if len(pattern) != 5 or not all(c in 'gyx' for c in pattern):
             raise ValueError("Pattern must be 5 characters of g/y/x")
         
-        self.guesses_made.append((guess, pattern))
-        self.possible_answers = self.filter_words(guess, pattern, self.possible_answers)
+        gi = self.word_to_idx.get(guess)
+        if gi is None:
+            raise ValueError(f"'{guess}' is not in the word list")
         
-        return len(self.possible_answers)
+        code = encode_pattern(pattern)
+        self.guesses_made.append((gi, code))
+        codes = self.pattern_matrix[gi, self.answer_indices]
+        self.answer_indices = self.answer_indices[codes == code]
+        
+        return len(self.answer_indices)
     
-    def calculate_entropy(self, guess: str, word_pool: set[str]) -> float:
+    def calculate_entropy(self, guess: str, word_pool: Union[set[str], np.ndarray]) -> float:
         """
         Calculate expected information gain (entropy) for a guess.
         
         Higher entropy = better guess (eliminates more possibilities on average)
         """
-        if not word_pool:
+        if len(word_pool) == 0:
             return 0.0
-            
-        pattern_counts: Counter = Counter()
-        for answer in word_pool:
-            pattern = self.get_pattern(guess, answer)
-            pattern_counts[pattern] += 1
-        
-        total = len(word_pool)
-        entropy = 0.0
-        for count in pattern_counts.values():
-            if count > 0:
-                p = count / total
-                entropy -= p * math.log2(p)
-                
-        return entropy
+        
+        return self._entropy_from_counts(self._pattern_counts(guess, word_pool))
     
-    def calculate_expected_remaining(self, guess: str, word_pool: set[str]) -> float:
+    def calculate_expected_remaining(self, guess: str, word_pool: Union[set[str], np.ndarray]) -> float:
         """
         Calculate expected number of remaining words after this guess.
         Lower = better
         """
-        if not word_pool:
+        if len(word_pool) == 0:
             return 0.0
-            
-        pattern_counts: Counter = Counter()
-        for answer in word_pool:
-            pattern = self.get_pattern(guess, answer)
-            pattern_counts[pattern] += 1
         
-        total = len(word_pool)
-        return sum(count * count for count in pattern_counts.values()) / total
+        return self._expected_from_counts(self._pattern_counts(guess, word_pool))
+    
+    def calculate_entropy_and_expected(self, guess: str,
+                                       word_pool: Union[set[str], np.ndarray]) -> tuple[float, float]:
+        """
+        Calculate entropy and expected remaining together, from one pattern
+        histogram (cheaper than calling both methods above).
+        
+        Returns: (entropy, expected_remaining)
+        """
+        if len(word_pool) == 0:
+            return 0.0, 0.0
+        
+        counts = self._pattern_counts(guess, word_pool)
+        return self._entropy_from_counts(counts), self._expected_from_counts(counts)
+    
+    def _pattern_counts(self, guess: str, word_pool: Union[set[str], np.ndarray]) -> np.ndarray:
+        """Histogram of feedback codes (length NUM_PATTERNS) for a guess over a word pool."""
+        return np.bincount(self._pool_codes(guess, word_pool), minlength=NUM_PATTERNS)
+    
+    @staticmethod
+    def _entropy_from_counts(counts: np.ndarray) -> float:
+        """Entropy in bits of a pattern histogram."""
+        p = counts[counts > 0] / counts.sum()
+        # 0.0 - ...: a single bucket gives 0.0, not -0.0
+        return float(0.0 - (p * np.log2(p)).sum())
+    
+    @staticmethod
+    def _expected_from_counts(counts: np.ndarray) -> float:
+        """Expected remaining pool size given a pattern histogram."""
+        return float((counts * counts).sum() / counts.sum())
     
     def get_word_score(self, word: str) -> float:
         """
@@ -261,12 +713,252 @@ class WordleSolver:
         In bot mode: uses word frequency (higher = more common = preferred)
         In normal mode: uses letter frequencies
         """
+        gi = self.word_to_idx.get(word)
+        if gi is not None:
+            return float(self.word_scores[gi])
+        return self._compute_word_score(word)
+    
+    def _compute_word_scores(self) -> np.ndarray:
+        """Tiebreaker scores for every valid guess, aligned with all_words."""
+        # Letter frequency score: sum over each word's distinct letters (mask bits)
+        freq_by_letter = np.array([self.letter_freq.get(chr(ord('a') + k), 0) for k in range(26)])
+        scores = masks_to_bits(self.letter_masks) @ freq_by_letter
+        
+        if self.bot_mode:
+            for word, freq in self.word_frequencies.items():
+                gi = self.word_to_idx.get(word)
+                if gi is not None:
+                    scores[gi] = math.log10(freq + 1) / 10
+        return scores
+    
+    def _compute_word_score(self, word: str) -> float:
+        """Compute the tiebreaker score (precomputed into word_scores for valid guesses)."""
         if self.bot_mode and word in self.word_frequencies:
             # Normalize frequency to 0-1 range using log scale
             freq = self.word_frequencies[word]
             return math.log10(freq + 1) / 10  # Scaled log frequency
         return sum(self.letter_freq.get(c, 0) for c in set(word))
     
+    def _candidate_rows(self) -> np.ndarray:
+        """
+        Guess rows to evaluate: every valid guess, or only the remaining
+        answers in hard mode.
+        
+        In a small pool (see SMALL_POOL_SIZE), if some answers split it
+        perfectly (expected remaining 1, i.e. maximal entropy), only those
+        are returned: they head the full ranking in either mode, so the
+        result is the same prefix.
+        """
+        if self._answers_only():
+            return self.answer_rows[self.answer_indices]
+        
+        if len(self.answer_indices) <= SMALL_POOL_SIZE:
+            answers = self.answer_rows[self.answer_indices]
+            _, expected = self._candidate_scores(answers)
+            if (expected == 1.0).any():
+                return answers[expected == 1.0]
+        return self.all_rows
+    
+    def _answers_only(self) -> bool:
+        """Whether _candidate_rows is restricted to the remaining answers."""
+        return self.hard_mode
+    
+    def _possible_rows(self) -> np.ndarray:
+        """Boolean mask over guess rows marking words that are still possible answers."""
+        mask = np.zeros(len(self.all_words), dtype=bool)
+        mask[self.answer_rows[self.answer_indices]] = True
+        return mask
+    
+    def _possible_candidates(self, candidates: np.ndarray) -> np.ndarray:
+        """Which candidates (from _candidate_rows) are still possible answers."""
+        if self._answers_only():
+            return np.ones(len(candidates), dtype=bool)
+        return self._possible_rows()[candidates]
+    
+    def _score_candidates(self, candidates: np.ndarray,
+                          show_progress: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Score guess rows against the remaining answers.
+        
+        Uses the Numba kernel when available (no progress output needed).
+        Otherwise large sweeps are split across forked worker processes on
+        multi-core machines, and the rest run in vectorized blocks here.
+        
+        Returns: (entropy, expected_remaining) arrays aligned with candidates
+        """
+        if njit is not None:
+            # np.asarray: the kernel takes a plain ndarray view of a memmap
+            return _score_kernel(np.asarray(self.pattern_matrix), candidates, self.answer_indices)
+        
+        workers = os.cpu_count() or 1
+        if (workers > 1 and len(candidates) * len(self.answer_indices) >= PARALLEL_MIN_WORK
+                and 'fork' in multiprocessing.get_all_start_methods()):
+            return self._score_forked(candidates, workers)
+        return self._score_blocks(candidates, show_progress)
+    
+    def _score_forked(self, candidates: np.ndarray, workers: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Score candidates in forked worker processes, one slice per worker.
+        
+        The pool is created on first use and kept for the solver's lifetime.
+        Workers inherit the pattern matrix (memory-mapped or copy-on-write),
+        so only candidate slices, the answer pool and score arrays are pickled.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context('fork'),
+                initializer=_init_score_worker, initargs=(self,))
+        
+        slices = np.array_split(candidates, workers)
+        parts = list(self._executor.map(_score_chunk, slices, [self.answer_indices] * len(slices)))
+        
+        return (np.concatenate([entropy for entropy, _ in parts]),
+                np.concatenate([expected for _, expected in parts]))
+    
+    def _score_blocks(self, candidates: np.ndarray,
+                      show_progress: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Score guess rows in vectorized NumPy blocks of SCORE_BLOCK_SIZE.
+        
+        Returns: (entropy, expected_remaining) arrays aligned with candidates
+        """
+        total = len(self.answer_indices)
+        entropy = np.empty(len(candidates))
+        expected = np.empty(len(candidates))
+        # Small sweeps finish before a progress line would be useful
+        show_progress = show_progress and len(candidates) > PROGRESS_INTERVAL
+        
+        for start in range(0, len(candidates), SCORE_BLOCK_SIZE):
+            if show_progress and start % PROGRESS_INTERVAL == 0:
+                print(f"\r   Analyzing: {start}/{len(candidates)} words...", end="", flush=True)
+            
+            rows = candidates[start:start + SCORE_BLOCK_SIZE]
+            codes = self.pattern_matrix[np.ix_(rows, self.answer_indices)]
+            
+            # Per-row histograms in one bincount: offset each row's codes
+            # into its own run of NUM_PATTERNS bins
+            offsets = (np.arange(len(rows), dtype=np.int32) * NUM_PATTERNS)[:, None]
+            counts = np.bincount((codes + offsets).ravel(), minlength=len(rows) * NUM_PATTERNS)
+            counts = counts.reshape(len(rows), NUM_PATTERNS)
+            
+            p = counts / total
+            log_p = np.log2(p, out=np.zeros_like(p), where=p > 0)
+            entropy[start:start + len(rows)] = 0.0 - (p * log_p).sum(axis=1)
+            expected[start:start + len(rows)] = (counts * counts).sum(axis=1) / total
+        
+        if show_progress:
+            print("\r" + " " * 50 + "\r", end="")
+        
+        return entropy, expected
+    
+    def _opening_cache_path(self, kind: str) -> str:
+        """Opening ranking cache file for this word list, scoring kind and mode."""
+        # Tiebreaker scores depend on letter / word frequencies, so key on them too
+        scores_hash = hashlib.sha1(self.word_scores.tobytes()).hexdigest()[:8]
+        mode = "_hard" if self.hard_mode else ""
+        return self._cache_path(f"opening_{kind}{mode}_{self._word_list_hash()}_{scores_hash}.json")
+    
+    def _load_opening_cache(self, kind: str, top_n: int) -> Optional[list[tuple[str, float, float, bool]]]:
+        """Return the cached opening ranking, or None if missing or too short."""
+        cache_path = self._opening_cache_path(kind)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                ranked = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠ Error reading {cache_path}: {e}")
+            return None
+        if len(ranked) < min(top_n, len(self._candidate_rows())):
+            return None
+        return [tuple(row) for row in ranked[:top_n]]
+    
+    def _save_opening_cache(self, kind: str, results: list[tuple[str, float, float, bool]]):
+        """Store the opening ranking (first guess, nothing filtered yet)."""
+        cache_path = self._opening_cache_path(kind)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f)
+        except OSError as e:
+            print(f"⚠ Could not cache opening guesses: {e}")
+    
+    def _live_positions(self) -> np.ndarray:
+        """
+        Per guess row, the number of positions whose letter occurs in some
+        remaining answer. The other positions are gray against every answer,
+        so a guess with k live positions yields at most 3^k distinct patterns.
+        """
+        union = np.bitwise_or.reduce(self.letter_masks[self.answer_rows[self.answer_indices]])
+        return ((union >> self.letters.astype(np.uint32)) & 1).sum(axis=1)
+    
+    def _outside_top_n(self, live: int, scores: np.ndarray, top_n: int, rank_by: str) -> bool:
+        """
+        Whether no guess with `live` live positions can make the top_n of the
+        scores found so far (NaN = not scored yet).
+        
+        With at most P = min(pool size, 3^live) patterns, entropy is at most
+        log2(P) and expected remaining at least pool size / P.
+        """
+        scored = scores[~np.isnan(scores)]
+        if top_n <= 0 or len(scored) == 0 or len(scored) < top_n:
+            return False
+        
+        total = len(self.answer_indices)
+        patterns = min(total, 3 ** live)
+        # The margin keeps exact ties (and float rounding) in the scored set
+        if rank_by == 'entropy':
+            kth = np.partition(scored, len(scored) - top_n)[len(scored) - top_n]
+            return math.log2(patterns) < kth - 1e-9
+        kth = np.partition(scored, top_n - 1)[top_n - 1]
+        return total / patterns > kth + 1e-9
+    
+    def _candidate_scores(self, candidates: np.ndarray, show_progress: bool = False,
+                          top_n: Optional[int] = None,
+                          rank_by: str = 'entropy') -> tuple[np.ndarray, np.ndarray]:
+        """
+        Scores for guess rows against the current answer pool.
+        
+        Rows already scored for this pool (e.g. by an earlier ranking call,
+        or in an earlier game that reached the same pool) are reused; only
+        the rest go through _score_candidates. The last SCORE_CACHE_SIZE
+        pools are kept.
+        
+        With top_n, only rows that can still rank in the top_n by rank_by
+        ('entropy' or 'expected') are scored: rows go in decreasing order of
+        live positions, stopping once the bound from _outside_top_n rules a
+        group out. Skipped rows come back as NaN.
+        
+        Returns: (entropy, expected_remaining) arrays aligned with candidates
+        """
+        state = self._answer_state_id()
+        if state in self._score_cache:
+            self._score_cache.move_to_end(state)
+        else:
+            self._score_cache[state] = (np.full(len(self.all_words), np.nan),
+                                        np.full(len(self.all_words), np.nan))
+            if len(self._score_cache) > SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+        entropy_by_row, expected_by_row = self._score_cache[state]
+        
+        missing = candidates[np.isnan(entropy_by_row[candidates])]
+        if top_n is None:
+            groups = [missing]
+        else:
+            live = self._live_positions()[missing]
+            groups = [missing[live == k] for k in range(5, -1, -1)]
+        
+        ranked_by_row = entropy_by_row if rank_by == 'entropy' else expected_by_row
+        for k, group in zip(range(5, -1, -1), groups):
+            if top_n is not None and self._outside_top_n(k, ranked_by_row[candidates], top_n, rank_by):
+                break  # Fewer live positions only lower the bound further
+            if len(group):
+                entropy, expected = self._score_candidates(group, show_progress)
+                entropy_by_row[group] = entropy
+                expected_by_row[group] = expected
+        
+        return entropy_by_row[candidates], expected_by_row[candidates]
+    
     def get_best_guess_bot(self, top_n: int = 10, show_progress: bool = True) -> list[tuple[str, float, float, bool]]:
         """
         Find optimal guesses using bot-style scoring (minimize expected remaining).
@@ -278,45 +970,43 @@ class WordleSolver:
         
         Returns: List of (word, expected_remaining, frequency_score, is_possible_answer) tuples
         """
-        if not self.possible_answers:
+        if len(self.answer_indices) == 0:
             return []
         
-        if len(self.possible_answers) == 1:
-            word = list(self.possible_answers)[0]
+        if len(self.answer_indices) == 1:
+            word = self.answer_words[self.answer_indices[0]]
             return [(word, 1.0, self.get_word_score(word), True)]
         
-        if len(self.possible_answers) == 2:
+        if len(self.answer_indices) == 2:
             results = []
-            for word in self.possible_answers:
+            for word in (self.answer_words[i] for i in self.answer_indices):
                 results.append((word, 1.0, self.get_word_score(word), True))
             results.sort(key=lambda x: -x[2])  # Sort by frequency
             return results
         
-        # Determine candidate pool
-        if self.hard_mode:
-            candidates = self.possible_answers
-        else:
-            # Consider all valid guesses
-            candidates = set(self.all_words)
+        # The opening ranking only depends on the word lists, so it is cached on disk
+        opening = not self.guesses_made
+        if opening:
+            cached = self._load_opening_cache("bot", top_n)
+            if cached is not None:
+                return cached
         
-        results = []
-        total = len(candidates)
-        
-        for i, word in enumerate(candidates):
-            if show_progress and i % 500 == 0:
-                print(f"\r   Analyzing: {i}/{total} words...", end="", flush=True)
-            
-            expected = self.calculate_expected_remaining(word, self.possible_answers)
-            freq_score = self.get_word_score(word)
-            is_possible = word in self.possible_answers
-            
-            results.append((word, expected, freq_score, is_possible))
-        
-        if show_progress:
-            print("\r" + " " * 50 + "\r", end="")
+        keep = max(top_n, OPENING_CACHE_SIZE) if opening else top_n
+        candidates = self._candidate_rows()
+        _, expected = self._candidate_scores(candidates, show_progress, top_n=keep, rank_by='expected')
+        is_possible = self._possible_candidates(candidates)
+        freq_scores = self.word_scores[candidates]
         
         # Sort by: expected remaining (asc), prefer possible answers, frequency (desc)
-        results.sort(key=lambda x: (x[1], -x[3], -x[2]))
+        # (the last key is the primary one; unscored NaN rows sort last)
+        order = top_k_order((-freq_scores, ~is_possible, expected), keep)
+        
+        results = [
+            (self.all_words[candidates[k]], float(expected[k]), float(freq_scores[k]), bool(is_possible[k]))
+            for k in order
+        ]
+        if opening:
+            self._save_opening_cache("bot", results)
         
         return results[:top_n]
     
@@ -326,57 +1016,81 @@ class WordleSolver:
         
         Returns: List of (word, entropy, expected_remaining, is_possible_answer) tuples
         """
-        if not self.possible_answers:
+        if len(self.answer_indices) == 0:
             return []
         
-        if len(self.possible_answers) == 1:
-            word = list(self.possible_answers)[0]
+        if len(self.answer_indices) == 1:
+            word = self.answer_words[self.answer_indices[0]]
             return [(word, 0.0, 1.0, True)]
         
-        if len(self.possible_answers) == 2:
-            return [(word, 1.0, 1.0, True) for word in self.possible_answers]
-        
-        # Determine candidate pool
-        candidates = self.possible_answers if self.hard_mode else set(self.all_words)
+        if len(self.answer_indices) == 2:
+            return [(self.answer_words[i], 1.0, 1.0, True) for i in self.answer_indices]
         
-        results = []
-        total = len(candidates)
+        # The opening ranking only depends on the word lists, so it is cached on disk
+        opening = not self.guesses_made
+        if opening:
+            cached = self._load_opening_cache("entropy", top_n)
+            if cached is not None:
+                return cached
         
-        for i, word in enumerate(candidates):
-            if show_progress and i % 500 == 0:
-                print(f"\r   Analyzing: {i}/{total} words...", end="", flush=True)
-            
-            entropy = self.calculate_entropy(word, self.possible_answers)
-            expected = self.calculate_expected_remaining(word, self.possible_answers)
-            is_possible = word in self.possible_answers
-            
-            results.append((word, entropy, expected, is_possible))
-        
-        if show_progress:
-            print("\r" + " " * 50 + "\r", end="")
+        keep = max(top_n, OPENING_CACHE_SIZE) if opening else top_n
+        candidates = self._candidate_rows()
+        entropy, expected = self._candidate_scores(candidates, show_progress, top_n=keep, rank_by='entropy')
+        is_possible = self._possible_candidates(candidates)
         
         # Sort: entropy (desc), prefer possible answers, lower expected, letter freq
-        results.sort(key=lambda x: (-x[1], -x[3], x[2], -self.get_word_score(x[0])))
+        # (the last key is the primary one; unscored NaN rows sort last)
+        ranked_entropy = np.round(entropy, RANK_DECIMALS)
+        order = top_k_order((-self.word_scores[candidates], expected, ~is_possible, -ranked_entropy), keep)
+        
+        results = [
+            (self.all_words[candidates[k]], float(entropy[k]), float(expected[k]), bool(is_possible[k]))
+            for k in order
+        ]
+        if opening:
+            self._save_opening_cache("entropy", results)
         
         return results[:top_n]
     
+    def get_best_possible_answers(self, top_n: int = 5) -> list[tuple[str, float, float, bool]]:
+        """
+        Rank only the words that could still be the answer.
+        
+        Reuses the scores computed by get_best_guess / get_best_guess_bot for
+        the current pool. Tuples follow the same layout as those methods for
+        the active mode.
+        """
+        rows = self.answer_rows[self.answer_indices]
+        entropy, expected = self._candidate_scores(rows)
+        
+        # (the last key is the primary one)
+        if self.bot_mode:
+            freq_scores = self.word_scores[rows]
+            order = top_k_order((-freq_scores, expected), top_n)
+            return [(self.all_words[rows[k]], float(expected[k]), float(freq_scores[k]), True)
+                    for k in order]
+        
+        order = top_k_order((expected, -np.round(entropy, RANK_DECIMALS)), top_n)
+        return [(self.all_words[rows[k]], float(entropy[k]), float(expected[k]), True)
+                for k in order]
+    
     def get_remaining_words(self, max_show: int = 20) -> list[str]:
         """Get list of remaining possible answers."""
-        return sorted(self.possible_answers)[:max_show]
+        return sorted(self.answer_words[i] for i in self.answer_indices)[:max_show]
     
     def reset(self):
         """Reset the solver to initial state."""
-        if self.bot_mode and self.solutions_list:
-            self.possible_answers = set(self.solutions_list)
-        else:
-            self.possible_answers = set(self.all_words)
+        self.answer_indices = np.arange(len(self.answer_words), dtype=np.int32)
         self.guesses_made = []
 
 
+# Pattern letter -> emoji square, for str.translate
+PATTERN_EMOJI = str.maketrans({'g': '🟩', 'y': '🟨', 'x': '⬛'})
+
+
 def format_pattern_visual(pattern: str) -> str:
     """Convert pattern string to emoji visualization."""
-    emoji_map = {'g': '🟩', 'y': '🟨', 'x': '⬛'}
-    return ''.join(emoji_map.get(c, c) for c in pattern)
+    return pattern.translate(PATTERN_EMOJI)
 
 
 def print_header():
@@ -431,18 +1145,13 @@ def print_recommendations(solver: WordleSolver):
     print("─" * 60)
     
     # If there are strategic guesses in top 10, show a separate "best possible answers" table
-    total_remaining = len(solver.possible_answers)
+    total_remaining = len(solver.answer_indices)
     
     if strategic_recs and total_remaining > 2:
-        # Get top 5 among possible answers only
+        # Get top 5 among possible answers only (reuses the scores computed above)
+        all_possible_ranked = solver.get_best_possible_answers(top_n=5)
+        
         if solver.bot_mode:
-            all_possible_ranked = sorted(
-                [(w, solver.calculate_expected_remaining(w, solver.possible_answers),
-                  solver.get_word_score(w), True)
-                 for w in solver.possible_answers],
-                key=lambda x: (x[1], -x[2])
-            )[:5]
-            
             print("\n" + "─" * 60)
             print("         TOP POSSIBLE ANSWERS (if you must guess one)")
             print("─" * 60)
@@ -452,13 +1161,6 @@ def print_recommendations(solver: WordleSolver):
             for i, (word, expected, freq, _) in enumerate(all_possible_ranked, 1):
                 print(f"{i:<5} {word.upper():<10} {expected:<10.1f} {freq:<10.3f}")
         else:
-            all_possible_ranked = sorted(
-                [(w, solver.calculate_entropy(w, solver.possible_answers),
-                  solver.calculate_expected_remaining(w, solver.possible_answers), True)
-                 for w in solver.possible_answers],
-                key=lambda x: (-x[1], x[2])
-            )[:5]
-            
             print("\n" + "─" * 60)
             print("         TOP POSSIBLE ANSWERS (if you must guess one)")
             print("─" * 60)
@@ -473,21 +1175,13 @@ def print_recommendations(solver: WordleSolver):
     # Show remaining words if few enough
     print(f"\n📊 Remaining possible answers: {total_remaining}")
     if total_remaining <= 20:
-        # Sort by score (best first)
+        # Sort by score (best first), from the scores computed above
+        ranked_remaining = solver.get_best_possible_answers(top_n=total_remaining)
         if solver.bot_mode:
-            ranked_remaining = sorted(
-                solver.possible_answers,
-                key=lambda w: (solver.calculate_expected_remaining(w, solver.possible_answers), 
-                              -solver.get_word_score(w))
-            )
             print("   (sorted by expected remaining, then frequency)")
         else:
-            ranked_remaining = sorted(
-                solver.possible_answers,
-                key=lambda w: -solver.calculate_entropy(w, solver.possible_answers)
-            )
             print("   (sorted by entropy, best first)")
-        print("   " + ", ".join(w.upper() for w in ranked_remaining))
+        print("   " + ", ".join(w.upper() for w, _, _, _ in ranked_remaining))
     elif total_remaining <= 50:
         remaining = solver.get_remaining_words(max_show=15)
         print("   " + ", ".join(w.upper() for w in remaining) + "...")
@@ -502,8 +1196,9 @@ def print_guess_history(solver: WordleSolver):
         return
     
     print("\n   Guess History:")
-    for i, (word, pattern) in enumerate(solver.guesses_made, 1):
-        print(f"   {i}. {word.upper()} → {format_pattern_visual(pattern)}")
+    for i, (gi, code) in enumerate(solver.guesses_made, 1):
+        word = solver.all_words[gi]
+        print(f"   {i}. {word.upper()} → {format_pattern_visual(decode_pattern(code))}")
     print()
 
 
@@ -601,7 +1296,7 @@ def interactive_mode(word_file: str = None, hard_mode: bool = False,
                 print("   • The answer isn't in our word list")
                 print("   Use 'reset' to start over.\n")
             elif remaining == 1:
-                answer = list(solver.possible_answers)[0]
+                answer = solver.answer_words[solver.answer_indices[0]]
                 print(f"\n🎯 THE ANSWER MUST BE: {answer.upper()}")
                 print("   (Only one possibility remaining!)\n")
             else:
@@ -625,15 +1320,20 @@ def batch_solve(guesses: list[tuple[str, str]], verbose: bool = True) -> Optiona
     solver = WordleSolver()
     
     for word, pattern in guesses:
-        solver.apply_guess(word, pattern)
+        try:
+            solver.apply_guess(word, pattern)
+        except ValueError as e:
+            if verbose:
+                print(f"   ⚠️  Error: {e}")
+            continue
         if verbose:
-            remaining = len(solver.possible_answers)
+            remaining = len(solver.answer_indices)
             print(f"After {word.upper()}: {remaining} words remaining")
     
-    if len(solver.possible_answers) == 0:
+    if len(solver.answer_indices) == 0:
         return None
-    elif len(solver.possible_answers) == 1:
-        answer = list(solver.possible_answers)[0]
+    elif len(solver.answer_indices) == 1:
+        answer = solver.answer_words[solver.answer_indices[0]]
         if verbose:
             print(f"\n✓ Answer: {answer.upper()}")
         return answer
@@ -708,14 +1408,18 @@ Pattern format: g=green, y=yellow, x=gray
             )
             
             for word, pattern in guesses:
-                solver.apply_guess(word, pattern)
-                remaining = len(solver.possible_answers)
+                try:
+                    solver.apply_guess(word, pattern)
+                except ValueError as e:
+                    print(f"   ⚠️  Error: {e}")
+                    continue
+                remaining = len(solver.answer_indices)
                 print(f"After {word.upper()}: {remaining} words remaining")
             
-            if len(solver.possible_answers) == 0:
+            if len(solver.answer_indices) == 0:
                 print("\n✗ No valid words remaining!")
-            elif len(solver.possible_answers) == 1:
-                answer = list(solver.possible_answers)[0]
+            elif len(solver.answer_indices) == 1:
+                answer = solver.answer_words[solver.answer_indices[0]]
                 print(f"\n✓ Answer: {answer.upper()}")
             else:
                 if args.bot: